@@ -17,29 +17,82 @@ Session files are stored in ~/.kradle/kradleverse/sessions/<session_id>/
 """
 
 import argparse
+import functools
 import json
+import mmap
 import os
+import random
+import re
+import secrets
+import shutil
 import signal
 import subprocess
 import sys
 import time
-import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson  # optional C JSON parser; stdlib json is the fallback
+except ImportError:
+    orjson = None
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+def dumps_bytes(obj) -> bytes:
+    """Serialize to compact JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def dumps_indented(obj) -> str:
+    """Serialize to 2-space-indented JSON, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def emit_json(obj):
+    """Write obj to stdout as JSON: indented for a terminal, compact
+    bytes in one buffered write when piped (agents parse it anyway, and
+    the indent whitespace roughly doubles the byte count)."""
+    if sys.stdout.isatty():
+        print(dumps_indented(obj))
+    else:
+        sys.stdout.buffer.write(dumps_bytes(obj) + b"\n")
+
 # Data lives in ~/.kradle/kradleverse/, scripts live alongside this file
 DATA_DIR = Path.home() / ".kradle" / "kradleverse"
 SCRIPTS_DIR = Path(__file__).parent
 
-from dotenv import load_dotenv
-load_dotenv(DATA_DIR / ".env")
-
-VERSION = (SCRIPTS_DIR / ".." / "VERSION").read_text().strip()
 KRADLEVERSE_API = "https://kradleverse.com/api/v1"
 SESSIONS_DIR = DATA_DIR / "sessions"
 
-AGENT_NAME = os.getenv("KRADLEVERSE_AGENT_NAME", "UnnamedAgent")
-API_KEY = os.getenv("KRADLEVERSE_API_KEY")
+# Populated by load_env(); commands that never touch the network skip the
+# dotenv import and .env parse entirely.
+AGENT_NAME = "UnnamedAgent"
+API_KEY = None
+_env_loaded = False
+
+
+def load_env():
+    """Load ~/.kradle/kradleverse/.env and populate credentials (idempotent)."""
+    global AGENT_NAME, API_KEY, _env_loaded
+    if _env_loaded:
+        return
+    from dotenv import load_dotenv
+    load_dotenv(DATA_DIR / ".env")
+    AGENT_NAME = os.getenv("KRADLEVERSE_AGENT_NAME", "UnnamedAgent")
+    API_KEY = os.getenv("KRADLEVERSE_API_KEY")
+    _env_loaded = True
+
+
+@functools.lru_cache(maxsize=1)
+def get_version() -> str:
+    """Read the VERSION file (cached for the invocation)."""
+    return (SCRIPTS_DIR / ".." / "VERSION").read_text().strip()
 
 
 def get_session_dir(session_id: str) -> Path:
@@ -57,9 +110,31 @@ def get_stream_file(session_id: str) -> Path:
     return get_session_dir(session_id) / "stream.sse"
 
 
+def get_cursor_file(session_id: str) -> Path:
+    """Get the stream cursor file path for a session."""
+    return get_session_dir(session_id) / "cursor"
+
+
+def load_stream_offset(session_id: str, state: dict) -> int:
+    """Read the consumed-stream byte offset.
+
+    Lives in a tiny sidecar file so advancing the cursor doesn't rewrite
+    state.json; falls back to the stream_offset saved at join time.
+    """
+    try:
+        return int(get_cursor_file(session_id).read_bytes())
+    except (OSError, ValueError):
+        return state.get("stream_offset", 0)
+
+
+def save_stream_offset(session_id: str, offset: int):
+    """Persist the consumed-stream byte offset."""
+    get_cursor_file(session_id).write_bytes(b"%d" % offset)
+
+
 def generate_session_id() -> str:
     """Generate a short unique session ID."""
-    return uuid.uuid4().hex[:8]
+    return secrets.token_hex(4)
 
 
 def log(msg: str):
@@ -68,26 +143,93 @@ def log(msg: str):
     print(f"[{ts}] {msg}")
 
 
+# (mtime_ns, parsed state) per state file so repeat loads within one
+# invocation skip the JSON re-decode when the file hasn't changed.
+_state_cache: dict = {}
+
+
 def load_state(session_id: str) -> dict:
     """Load session state from disk."""
     state_file = get_state_file(session_id)
-    if not state_file.exists():
+    try:
+        mtime = state_file.stat().st_mtime_ns
+    except OSError:
         print(f"ERROR: No state file for session {session_id}")
         print("Is the game running? Use /kradleverse-join first.")
         sys.exit(1)
+    cached = _state_cache.get(state_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     try:
-        return json.loads(state_file.read_text())
-    except json.JSONDecodeError as e:
+        state = _loads(state_file.read_bytes())
+    except ValueError as e:
         print(f"ERROR: Invalid state file: {e}")
         sys.exit(1)
+    _state_cache[state_file] = (mtime, state)
+    return state
+
+
+# Session dirs we've already created this invocation; saves the mkdir
+# syscalls on repeat writes.
+_session_dirs_made: set = set()
 
 
 def save_state(session_id: str, state: dict):
     """Save session state to disk."""
     session_dir = get_session_dir(session_id)
-    session_dir.mkdir(parents=True, exist_ok=True)
+    if session_id not in _session_dirs_made:
+        session_dir.mkdir(parents=True, exist_ok=True)
+        _session_dirs_made.add(session_id)
     state_file = get_state_file(session_id)
-    state_file.write_text(json.dumps(state))
+    # Write-then-rename so a crash mid-write can't leave a torn state.json
+    tmp = state_file.with_suffix(".json.tmp")
+    tmp.write_bytes(dumps_bytes(state))
+    os.replace(tmp, state_file)
+    try:
+        _state_cache[state_file] = (state_file.stat().st_mtime_ns, state)
+    except OSError:
+        pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_requests():
+    """Import and return the requests module (lazy, cached)."""
+    import requests
+    return requests
+
+
+_http_session = None
+
+
+def get_http_session():
+    """Shared requests.Session with keep-alive and a small connection pool.
+
+    Created lazily so commands that never touch the network don't pay the
+    requests import.
+    """
+    global _http_session
+    if _http_session is None:
+        requests = get_requests()
+        from requests.adapters import HTTPAdapter
+
+        _http_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        _http_session.mount("https://", adapter)
+        _http_session.mount("http://", adapter)
+    return _http_session
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@functools.lru_cache(maxsize=1)
+def auth_headers() -> dict:
+    """Common JSON + Authorization headers, built once per invocation.
+
+    requests never mutates the headers dict it's given, so sharing one
+    instance across calls is safe. Call only after load_env().
+    """
+    return {"Content-Type": "application/json", "Authorization": f"Bearer {API_KEY}"}
 
 
 def api_call(method: str, path: str, *, json_body: dict = None, params: dict = None,
@@ -108,18 +250,19 @@ def api_call(method: str, path: str, *, json_body: dict = None, params: dict = N
     Raises:
         SystemExit: On HTTP errors or request failures.
     """
-    import requests
+    requests = get_requests()
 
     url = f"{KRADLEVERSE_API}{path}"
-    headers = {"Content-Type": "application/json"}
     if auth:
         if not API_KEY:
             log("ERROR: KRADLEVERSE_API_KEY not set in ~/.kradle/kradleverse/.env")
             sys.exit(1)
-        headers["Authorization"] = f"Bearer {API_KEY}"
+        headers = auth_headers()
+    else:
+        headers = _JSON_HEADERS
 
     try:
-        resp = requests.request(
+        resp = get_http_session().request(
             method, url, json=json_body, params=params,
             headers=headers, timeout=timeout,
         )
@@ -135,19 +278,36 @@ def api_call(method: str, path: str, *, json_body: dict = None, params: dict = N
     return resp.json()
 
 
+# Short-TTL cache for idempotent GETs in api_call_safe: back-to-back
+# identical polls (e.g. several sessions checking queue status in one
+# invocation) collapse into a single round-trip.
+_get_cache: dict = {}
+GET_CACHE_TTL = float(os.getenv("KRADLEVERSE_GET_CACHE_TTL", "0.2"))
+
+
 def api_call_safe(method: str, path: str, **kwargs) -> dict | None:
     """Like api_call but returns None on error instead of exiting."""
-    import requests
+    cache_key = None
+    if method == "GET":
+        params = kwargs.get("params")
+        cache_key = (path, tuple(sorted(params.items())) if params else None)
+        hit = _get_cache.get(cache_key)
+        if hit is not None and hit[0] > time.monotonic():
+            return hit[1]
+    else:
+        # Mutations can invalidate anything we cached.
+        _get_cache.clear()
 
     url = f"{KRADLEVERSE_API}{path}"
-    headers = {"Content-Type": "application/json"}
     if kwargs.get("auth", True):
         if not API_KEY:
             return None
-        headers["Authorization"] = f"Bearer {API_KEY}"
+        headers = auth_headers()
+    else:
+        headers = _JSON_HEADERS
 
     try:
-        resp = requests.request(
+        resp = get_http_session().request(
             method, url,
             json=kwargs.get("json_body"),
             params=kwargs.get("params"),
@@ -156,7 +316,10 @@ def api_call_safe(method: str, path: str, **kwargs) -> dict | None:
         )
         if resp.status_code >= 400:
             return None
-        return resp.json()
+        data = resp.json()
+        if cache_key is not None:
+            _get_cache[cache_key] = (time.monotonic() + GET_CACHE_TTL, data)
+        return data
     except Exception:
         return None
 
@@ -164,16 +327,13 @@ def api_call_safe(method: str, path: str, **kwargs) -> dict | None:
 def kradle_api_call(method: str, kradle_api_url: str, path: str, *,
                     json_body: dict = None, timeout: int = 30) -> dict:
     """Make a request directly to the Kradle API."""
-    import requests
+    requests = get_requests()
 
     url = f"{kradle_api_url}{path}"
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {API_KEY}",
-    }
+    headers = auth_headers()
 
     try:
-        resp = requests.request(
+        resp = get_http_session().request(
             method, url, json=json_body,
             headers=headers, timeout=timeout,
         )
@@ -194,34 +354,79 @@ def kradle_api_call(method: str, kradle_api_url: str, path: str, *,
 # ---------------------------------------------------------------------------
 
 def start_observation_stream(session_id: str, kradle_api_url: str, kradle_run_id: str) -> int:
-    """Start a background curl process to stream observations via SSE.
+    """Start a background process to stream observations via SSE.
 
-    Returns the PID of the curl process.
+    Uses curl when available, otherwise a Python child running the hidden
+    _stream-worker subcommand. Returns the PID of the child.
     """
     stream_file = get_stream_file(session_id)
     url = f"{kradle_api_url}/runs/{kradle_run_id}/observations/stream"
 
-    f = open(stream_file, "w")
-    proc = subprocess.Popen(
-        ["curl", "-N", "-s", "-H", f"Authorization: Bearer {API_KEY}", url],
-        stdout=f,
-        stderr=subprocess.DEVNULL,
-    )
-    f.close()  # child process inherited the fd
+    if shutil.which("curl"):
+        argv = ["curl", "-N", "-s", "-H", f"Authorization: Bearer {API_KEY}", url]
+    else:
+        argv = [sys.executable, os.path.abspath(__file__), "_stream-worker", url]
+
+    # Hand the child a raw O_APPEND fd: no Python buffering layer in
+    # between, and the kernel appends atomically.
+    fd = os.open(stream_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_APPEND, 0o644)
+    proc = subprocess.Popen(argv, stdout=fd, stderr=subprocess.DEVNULL)
+    os.close(fd)  # child process inherited the fd
 
     return proc.pid
 
 
+def cmd_stream_worker(args):
+    """Internal: stream an SSE URL to stdout (curl replacement)."""
+    load_env()
+    out = sys.stdout.buffer
+    resp = get_http_session().get(
+        args.url,
+        headers={"Authorization": f"Bearer {API_KEY}"},
+        stream=True,
+        timeout=(5, None),
+    )
+    with resp:
+        for chunk in resp.iter_content(chunk_size=4096):
+            if chunk:
+                out.write(chunk)
+                out.flush()
+
+
 def stop_observation_stream(pid: int):
-    """Stop a running curl stream process."""
+    """Stop a running curl stream process, escalating to SIGKILL if needed."""
     try:
         os.kill(pid, signal.SIGTERM)
     except (ProcessLookupError, PermissionError):
+        return
+    # Give curl a moment to exit cleanly before forcing the issue.
+    for delay in (0.02, 0.05, 0.1, 0.25, 0.5):
+        time.sleep(delay)
+        if not is_stream_alive(pid):
+            break
+    else:
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    # Reap it if it happens to be our child (no-op otherwise).
+    try:
+        os.waitpid(pid, os.WNOHANG)
+    except (ChildProcessError, OSError):
         pass
 
 
 def is_stream_alive(pid: int) -> bool:
     """Check if a stream process is still running."""
+    if sys.platform.startswith("linux"):
+        # Reading /proc also guards against the pid being reused by an
+        # unrelated process after the curl stream died.
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read()
+            return b"curl" in cmdline or b"_stream-worker" in cmdline
+        except OSError:
+            return False
     try:
         os.kill(pid, 0)
         return True
@@ -229,8 +434,13 @@ def is_stream_alive(pid: int) -> bool:
         return False
 
 
-def parse_sse_observations(raw: str) -> list[dict]:
-    """Parse raw SSE text and extract observation data payloads.
+# Matches SSE data lines; everything else (keepalives, ids, comments) is
+# skipped by the regex engine without creating Python objects.
+_DATA_RE = re.compile(rb"^data: (.+)$", re.MULTILINE)
+
+
+def parse_sse_observations(raw: bytes) -> list[dict]:
+    """Parse raw SSE bytes and extract observation data payloads.
 
     SSE format from Kradle:
         : connected
@@ -239,42 +449,100 @@ def parse_sse_observations(raw: str) -> list[dict]:
         : keepalive
         event: done
         data: {}
+
+    Works directly on bytes: a single compiled-regex scan pulls out the
+    data payloads, so keepalive/comment lines are never materialized.
     """
     observations = []
-    for line in raw.split("\n"):
-        if line.startswith("data: "):
-            payload = line[6:]
-            if not payload or payload == "{}":
-                continue
-            try:
-                event = json.loads(payload)
-                if "data" in event:
-                    observations.append(event)
-            except json.JSONDecodeError:
-                continue
+    for m in _DATA_RE.finditer(raw):
+        payload = m.group(1)
+        if payload == b"{}":
+            continue
+        try:
+            event = _loads(payload)
+            if "data" in event:
+                observations.append(event)
+        except ValueError:
+            continue
     return observations
 
 
-def read_stream_observations(session_id: str, offset: int = 0) -> tuple[list[dict], int]:
-    """Read new observations from the stream file starting at byte offset.
+# Cap on unread backlog per read. Rotating/truncating the file itself is
+# not an option (curl holds an O_APPEND fd and would keep writing to the
+# old inode), so readers bound their own cost by skipping ancient backlog.
+MAX_STREAM_READ = 4 * 1024 * 1024
 
-    Returns (observations, new_offset).
+
+def read_stream_raw(session_id: str, offset: int = 0) -> tuple[bytes, int]:
+    """Read the unparsed tail of the stream file starting at byte offset.
+
+    If the unread backlog exceeds MAX_STREAM_READ, older data is skipped
+    and reading resumes at the next record boundary within the cap.
+    Returns (raw_bytes, new_offset).
     """
     stream_file = get_stream_file(session_id)
     if not stream_file.exists():
-        return [], offset
+        return b"", offset
 
     file_size = stream_file.stat().st_size
     if file_size <= offset:
-        return [], offset
+        return b"", offset
+
+    clamped = file_size - offset > MAX_STREAM_READ
+    if clamped:
+        offset = file_size - MAX_STREAM_READ
+
+    with open(stream_file, "rb") as f:
+        if os.name == "posix":
+            # Zero-copy window onto the file; only the tail past `offset`
+            # is materialized as a Python object.
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                raw = mm[offset:file_size]
+            finally:
+                mm.close()
+            new_offset = file_size
+        else:
+            f.seek(offset)
+            raw = f.read()
+            new_offset = f.tell()
+
+    if clamped:
+        # Drop the partial line at the clamp point.
+        nl = raw.find(b"\n")
+        raw = raw[nl + 1:] if nl >= 0 else b""
+
+    return raw, new_offset
 
-    with open(stream_file, "r") as f:
-        f.seek(offset)
-        new_data = f.read()
-        new_offset = f.tell()
 
-    observations = parse_sse_observations(new_data)
-    return observations, new_offset
+def read_stream_observations(session_id: str, offset: int = 0) -> tuple[list[dict], int]:
+    """Read new observations from the stream file starting at byte offset.
+
+    Returns (observations, new_offset).
+    """
+    raw, new_offset = read_stream_raw(session_id, offset)
+    if not raw:
+        return [], new_offset
+    return parse_sse_observations(raw), new_offset
+
+
+def wait_for_stream_data(session_id: str, offset: int, timeout: float) -> bool:
+    """Wait until the stream file grows past `offset` or the timeout expires.
+
+    Uses cheap stat() polling at 100 ms so waiters wake up shortly after
+    new data lands instead of sleeping through a fixed interval.
+    Returns True if new data is available.
+    """
+    stream_file = get_stream_file(session_id)
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if stream_file.stat().st_size > offset:
+                return True
+        except OSError:
+            pass
+        time.sleep(0.1)
+    return False
 
 
 # ---------------------------------------------------------------------------
@@ -282,39 +550,46 @@ def read_stream_observations(session_id: str, offset: int = 0) -> tuple[list[dic
 # ---------------------------------------------------------------------------
 
 # Fields that belong to "current state" (only need latest value)
-STATE_FIELDS = {"position", "health", "players", "blocks", "entities", "inventory", "run_status", "run_id", "xp", "score", "gamemode", "equipped", "winner", "is_alive", "craftable", "time_of_day", "name"}
+STATE_FIELDS = frozenset({"position", "health", "players", "blocks", "entities", "inventory", "run_status", "run_id", "xp", "score", "gamemode", "equipped", "winner", "is_alive", "craftable", "time_of_day", "name"})
 
 # Fields we don't care about
-EXCLUDED_FIELDS = {"task", "observation_id", "time", "run_id", "idle", "biome", "weather", "on_ground", "participant_id", "executing", "hunger", "lives"}
+EXCLUDED_FIELDS = frozenset({"task", "observation_id", "time", "run_id", "idle", "biome", "weather", "on_ground", "participant_id", "executing", "hunger", "lives"})
 
+# State fields actually reported (run_id is both state and excluded)
+CURRENT_STATE_FIELDS = STATE_FIELDS - EXCLUDED_FIELDS
 
-def filter_observation(obs: dict) -> dict:
-    res = {
-        **{field: obs[field] for field in obs.keys() if field not in EXCLUDED_FIELDS},
-    }
-    if "output" in obs:
-        res["output"] = obs["output"][:500] if obs["output"] else None
-    return res
+# Event fields skip state, excluded, and empty values in one pass
+_NON_EVENT_FIELDS = STATE_FIELDS | EXCLUDED_FIELDS
 
 
 def extract_event(obs: dict) -> dict:
-    """Extract only event-relevant fields from an observation."""
+    """Extract only event-relevant fields from a raw observation.
+
+    Single traversal: drops state/excluded fields and empty values, and
+    truncates long command output inline.
+    """
+    if obs.keys() <= _NON_EVENT_FIELDS:
+        return {}  # pure state snapshot, nothing event-only to extract
     event = {}
-    for field in set(obs.keys()).difference(STATE_FIELDS):
-        if field in obs:
-            value = obs[field]
-            if value is None:
-                continue
-            if isinstance(value, list) and len(value) == 0:
-                continue
-            event[field] = value
+    for field, value in obs.items():
+        if field in _NON_EVENT_FIELDS:
+            continue
+        if field == "output":
+            if value:
+                event[field] = value[:500]
+            continue
+        if value is None:
+            continue
+        if isinstance(value, list) and len(value) == 0:
+            continue
+        event[field] = value
     return event
 
 
 def extract_current_state(obs: dict) -> dict:
     """Extract current state fields from the latest observation."""
     state = {}
-    for field in STATE_FIELDS:
+    for field in CURRENT_STATE_FIELDS:
         if field in obs:
             state[field] = obs[field]
     return state
@@ -342,34 +617,38 @@ def join_queue() -> dict:
 
 
 def wait_for_assignment(timeout: int) -> dict:
-    """Poll queue status until assigned to a run. Returns the status response."""
-    start = time.time()
-    poll_interval = 5
+    """Poll queue status until assigned to a run. Returns the status response.
+
+    Polls eagerly at first and backs off (with jitter, so parallel agents
+    don't sync up) the longer the queue stays quiet; any status change
+    resets to the fast cadence.
+    """
+    deadline = time.monotonic() + timeout
+    interval = 1.0
     last_status = None
 
-    while time.time() - start < timeout:
+    while time.monotonic() < deadline:
         data = api_call_safe("GET", "/queue/status", params={"agentId": AGENT_NAME})
-        if not data:
-            time.sleep(poll_interval)
-            continue
-
-        if not data.get("inQueue"):
-            log("ERROR: No longer in queue (entry may have expired)")
-            sys.exit(1)
-
-        entry = data.get("queueEntry", {})
-        status = entry.get("status")
-
-        if status != last_status:
-            if status == "waiting":
-                pos = entry.get("position", "?")
-                log(f"Waiting in queue (position: {pos})...")
-            elif status in ("assigned", "connected"):
-                log(f"Assigned to a run!")
-                return data
-            last_status = status
-
-        time.sleep(poll_interval)
+        if data:
+            if not data.get("inQueue"):
+                log("ERROR: No longer in queue (entry may have expired)")
+                sys.exit(1)
+
+            entry = data.get("queueEntry", {})
+            status = entry.get("status")
+
+            if status != last_status:
+                interval = 1.0
+                if status == "waiting":
+                    pos = entry.get("position", "?")
+                    log(f"Waiting in queue (position: {pos})...")
+                elif status in ("assigned", "connected"):
+                    log(f"Assigned to a run!")
+                    return data
+                last_status = status
+
+        time.sleep(interval * random.uniform(0.9, 1.1))
+        interval = min(interval * 1.5, 10.0)
 
     log("ERROR: Timeout waiting for game assignment")
     sys.exit(1)
@@ -481,8 +760,8 @@ def cmd_join(args):
         stream_pid = start_observation_stream(session_id, kradle_api_url, kradle_run_id)
         log(f"Stream started (PID: {stream_pid})")
 
-    # Save initial state
-    save_state(session_id, {
+    # Save initial state (kept in a local so later saves don't re-read it)
+    state = {
         "kradle_run_id": kradle_run_id,
         "kradle_api_url": kradle_api_url,
         "kradleverse_run_id": kv_run_id,
@@ -494,75 +773,77 @@ def cmd_join(args):
         "js_functions": None,
         "started_at": datetime.now(timezone.utc).isoformat(),
         "status": "waiting_for_init",
-    })
+    }
+    save_state(session_id, state)
 
-    # Wait for init_call by reading the SSE stream file
+    # Wait for init_call and initial_state in a single pass over the SSE
+    # stream. Both arrive on the same stream, so watching for them in one
+    # loop means the wall-clock cost is the max of the two arrival times,
+    # not the sum — in the common case initial_state lands in the same
+    # read as (or just after) init_call.
     remaining_timeout = max(10, args.timeout - 60)
     log(f"Waiting for arena to start (timeout: {remaining_timeout}s)...")
 
     init_data = None
-    start = time.time()
+    initial_state = None
+    init_deadline = time.monotonic() + remaining_timeout
+    state_deadline = None  # set once init_call arrives
     offset = 0
 
-    while time.time() - start < remaining_timeout:
+    while initial_state is None:
+        now = time.monotonic()
+        if init_data is None:
+            if now >= init_deadline:
+                break
+        elif now >= state_deadline:
+            break
+
         observations, offset = read_stream_observations(session_id, offset)
 
         for obs in observations:
             obs_data = obs.get("data", {})
-            if obs_data.get("level") == "init_call":
+            level = obs_data.get("level")
+            if init_data is None and level == "init_call":
                 init_data = obs_data.get("data", {})
-                break
+                # Checkpoint so a Ctrl-C before initial_state still
+                # leaves a resumable session.
+                state.update({
+                    "stream_offset": offset,
+                    "task": init_data.get("task", ""),
+                    "js_functions": init_data.get("js_functions", ""),
+                })
+                save_state(session_id, state)
+                state_deadline = time.monotonic() + 30
+                log("Waiting for initial game state...")
+            elif level == "observation":
+                inner = obs_data.get("data", {})
+                if inner.get("event") == "initial_state":
+                    initial_state = inner
+                    break
 
-        if init_data:
-            break
-        time.sleep(2)
+        if initial_state is None:
+            wait_for_stream_data(session_id, offset, 2)
 
     if not init_data:
         log("ERROR: Timeout waiting for arena to start")
         log("The run may still be provisioning. Try observing later:")
         log(f"  kradleverse.py observe {session_id}")
         # Save state anyway so observe can be used manually
-        save_state(session_id, {
-            **load_state(session_id),
-            "stream_offset": offset,
-            "status": "playing",
-        })
+        state.update({"stream_offset": offset, "status": "playing"})
+        save_state(session_id, state)
         sys.exit(2)
 
     task = init_data.get("task", "")
     js_functions = init_data.get("js_functions", "")
 
-    # Wait for initial_state observation
-    log("Waiting for initial game state...")
-    initial_state = None
-    state_start = time.time()
-    while time.time() - state_start < 30:
-        observations, offset = read_stream_observations(session_id, offset)
-        for obs in observations:
-            obs_data = obs.get("data", {})
-            if obs_data.get("level") == "observation":
-                inner = obs_data.get("data", {})
-                if inner.get("event") == "initial_state":
-                    initial_state = inner
-                    break
-        if initial_state:
-            break
-        time.sleep(2)
-
     # Update state with game info
-    save_state(session_id, {
-        "kradle_run_id": kradle_run_id,
-        "kradle_api_url": kradle_api_url,
-        "kradleverse_run_id": kv_run_id,
-        "participant_name": participant_name,
-        "agent_name": AGENT_NAME,
-        "stream_pid": stream_pid,
+    state.update({
         "stream_offset": offset,
         "task": task,
         "js_functions": js_functions,
-        "started_at": datetime.now(timezone.utc).isoformat(),
         "status": "playing",
     })
+    save_state(session_id, state)
 
     # Output game info
     print("\n" + "=" * 50)
@@ -571,18 +852,18 @@ def cmd_join(args):
     print(f"RUN: {kv_run_id}")
     print("=" * 50)
     print("Game info:")
-    print(json.dumps({
+    print(dumps_indented({
         "kradleverse_run_id": kv_run_id,
         "kradle_run_id": kradle_run_id,
         "agent_name": AGENT_NAME,
         "participant_name": participant_name,
         "task": task,
         "available_skills_js_functions": js_functions,
-    }, indent=2))
+    }))
     print("=" * 50)
     if initial_state:
         print("Initial state:")
-        print(json.dumps({
+        print(dumps_indented({
             "position": initial_state.get("position"),
             "health": initial_state.get("health"),
             "inventory": initial_state.get("inventory"),
@@ -590,7 +871,7 @@ def cmd_join(args):
             "players": initial_state.get("players"),
             "score": initial_state.get("score"),
             "chat": initial_state.get("chat", [])[:10],
-        }, indent=2))
+        }))
     else:
         print("(Initial state not yet available - use observe to get it)")
     print("=" * 50)
@@ -603,44 +884,44 @@ def cmd_join(args):
 def cmd_observe(args):
     """Get observations from the SSE stream file."""
     state = load_state(args.session)
-    offset = state.get("stream_offset", 0)
+    offset = load_stream_offset(args.session, state)
 
     observations, new_offset = read_stream_observations(args.session, offset)
 
     if not observations:
-        print(json.dumps({"current_state": {}, "events": [], "total_events": 0}))
+        emit_json({"current_state": {}, "events": [], "total_events": 0})
         return
 
-    # Extract observation data from SSE events
-    obs_data = []
+    # Extract observation data from SSE events in a single pass: each
+    # observation is reduced to its event immediately, and only the
+    # latest one is kept around for the current-state summary.
+    events = []
+    latest = None
     for obs in observations:
         inner = obs.get("data", {})
         if inner.get("level") == "observation" and "data" in inner:
-            obs_data.append(filter_observation(inner["data"]))
-
-    if not obs_data:
-        print(json.dumps({"current_state": {}, "events": [], "total_events": 0}))
-        # Still advance offset even if no observation-level entries
-        if not args.peek:
-            state["stream_offset"] = new_offset
-            save_state(args.session, state)
+            latest = inner["data"]
+            events.append(extract_event(latest))
+
+    if latest is None:
+        emit_json({"current_state": {}, "events": [], "total_events": 0})
+        # Still advance the offset past larger no-observation stretches;
+        # tiny keepalive-only advances aren't worth a write (the bytes
+        # just get re-scanned next call).
+        if not args.peek and new_offset - offset >= 4096:
+            save_stream_offset(args.session, new_offset)
         return
 
-    latest = obs_data[-1]
-    current_state = extract_current_state(latest)
-    events = [extract_event(obs) for obs in obs_data]
-
     output = {
-        "current_state": current_state,
+        "current_state": extract_current_state(latest),
         "events": events,
-        "total_events": len(obs_data),
+        "total_events": len(events),
     }
-    print(json.dumps(output, indent=2))
+    emit_json(output)
 
     # Update stream offset (advance cursor) unless peeking
     if not args.peek:
-        state["stream_offset"] = new_offset
-        save_state(args.session, state)
+        save_stream_offset(args.session, new_offset)
 
 
 def cmd_act(args):
@@ -661,12 +942,15 @@ def cmd_status(args):
             log("No sessions found")
             return
         sessions = []
-        for session_dir in SESSIONS_DIR.iterdir():
-            if session_dir.is_dir() and (session_dir / "state.json").exists():
+        with os.scandir(SESSIONS_DIR) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
                 try:
-                    state = json.loads((session_dir / "state.json").read_text())
-                    sessions.append((session_dir.name, state))
-                except (json.JSONDecodeError, OSError):
+                    with open(os.path.join(entry.path, "state.json"), "rb") as f:
+                        state = _loads(f.read())
+                    sessions.append((entry.name, state))
+                except (ValueError, OSError):
                     pass
         if sessions:
             log(f"Sessions ({len(sessions)}):")
@@ -701,16 +985,18 @@ def cmd_cleanup(args):
     """Remove all session data and stop any running streams."""
     if SESSIONS_DIR.exists():
         # Kill any running stream processes first
-        for session_dir in SESSIONS_DIR.iterdir():
-            if session_dir.is_dir() and (session_dir / "state.json").exists():
+        with os.scandir(SESSIONS_DIR) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
                 try:
-                    state = json.loads((session_dir / "state.json").read_text())
+                    with open(os.path.join(entry.path, "state.json"), "rb") as f:
+                        state = _loads(f.read())
                     pid = state.get("stream_pid")
                     if pid:
                         stop_observation_stream(pid)
-                except (json.JSONDecodeError, OSError):
+                except (ValueError, OSError):
                     pass
-        import shutil
         shutil.rmtree(SESSIONS_DIR)
         log("All sessions removed (streams stopped)")
     else:
@@ -724,6 +1010,7 @@ def cmd_init(args):
 
     # Check if already registered
     if env_file.exists():
+        from dotenv import load_dotenv
         load_dotenv(env_file, override=True)
         existing_name = os.getenv("KRADLEVERSE_AGENT_NAME", "")
         existing_key = os.getenv("KRADLEVERSE_API_KEY", "")
@@ -769,34 +1056,62 @@ def cmd_init(args):
 # Update checking
 # ---------------------------------------------------------------------------
 
-LAST_CHECK_FILE = DATA_DIR / ".last_update_check"
+UPDATE_CACHE_FILE = DATA_DIR / ".update_cache.json"
 UPDATE_CHECK_INTERVAL = 12 * 60 * 60  # 12 hours
 REMOTE_VERSION_URL = "https://raw.githubusercontent.com/Kradle-ai/KradleVerse/main/VERSION"
 README_URL = "https://github.com/Kradle-ai/KradleVerse#update"
 
 
 def _check_for_updates(force=False):
-    """Check for updates every 12 hours. Never raises exceptions."""
+    """Check for updates every 12 hours. Never raises exceptions.
+
+    Sends the previously seen ETag so an unchanged VERSION file comes
+    back as a bodyless 304.
+    """
     try:
-        if not force and LAST_CHECK_FILE.exists():
-            last_check = float(LAST_CHECK_FILE.read_text().strip())
-            if time.time() - last_check < UPDATE_CHECK_INTERVAL:
-                return
+        cache = {}
+        try:
+            cache = _loads(UPDATE_CACHE_FILE.read_bytes())
+        except (OSError, ValueError):
+            pass
+        if not force and time.time() - cache.get("last_check", 0) < UPDATE_CHECK_INTERVAL:
+            return
 
-        import requests as _req
-        resp = _req.get(REMOTE_VERSION_URL, timeout=3)
-        resp.raise_for_status()
-        remote_version = resp.text.strip()
+        # One-shot GET: stdlib urllib keeps check-update from importing
+        # the whole requests/urllib3 chain just to fetch a version string.
+        import urllib.error
+        import urllib.request
 
-        LAST_CHECK_FILE.write_text(str(time.time()))
+        etag = cache.get("etag")
+        req = urllib.request.Request(
+            REMOTE_VERSION_URL,
+            headers={"If-None-Match": etag} if etag else {},
+        )
+        try:
+            with urllib.request.urlopen(req, timeout=3) as resp:
+                remote_version = resp.read().decode().strip()
+                etag = resp.headers.get("ETag")
+        except urllib.error.HTTPError as e:
+            if e.code != 304:
+                raise
+            remote_version = cache.get("remote_version", "")
+
+        UPDATE_CACHE_FILE.write_bytes(dumps_bytes({
+            "last_check": time.time(),
+            "etag": etag,
+            "remote_version": remote_version,
+        }))
+
+        if not remote_version:
+            return
 
-        if remote_version != VERSION:
-            print(f"\n⚠️  A kradleverse update is available: {VERSION} → {remote_version}")
+        if remote_version != get_version():
+            print(f"\n⚠️  A kradleverse update is available: {get_version()} → {remote_version}")
             print(f"   Update instructions: {README_URL}\n")
             print("    Please tell your user you can update to the latest version if they want to.")
             print("    As an AI, you can update the version yourself (follow the same instructions) if the user agrees to. Always suggest to perform the update yourself before suggesting the user can do it themselves.")
         elif force:
-            print(f"kradleverse is up to date (v{VERSION})")
+            print(f"kradleverse is up to date (v{get_version()})")
     except Exception:
         pass
 
@@ -816,8 +1131,14 @@ def main():
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog=__doc__,
     )
-    parser.add_argument("-v", "--version", action="version", version=f"kradleverse {VERSION}")
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
+    parser.add_argument("-v", "--version", action="version", version=f"kradleverse {get_version()}")
+    # metavar lists only the public commands so the internal
+    # _stream-worker subparser stays out of --help/usage.
+    subparsers = parser.add_subparsers(
+        dest="command",
+        help="Commands",
+        metavar="{init,join,observe,act,status,cleanup,check-update}",
+    )
 
     # init
     init_parser = subparsers.add_parser("init", help="Register a new agent")
@@ -856,18 +1177,37 @@ def main():
     check_update_parser = subparsers.add_parser("check-update", help="Check for updates")
     check_update_parser.set_defaults(func=cmd_check_update)
 
+    # _stream-worker (internal: SSE streaming child when curl is unavailable)
+    stream_worker_parser = subparsers.add_parser("_stream-worker")
+    stream_worker_parser.add_argument("url")
+    stream_worker_parser.set_defaults(func=cmd_stream_worker)
+
     args = parser.parse_args()
 
     if not args.command:
         parser.print_help()
         sys.exit(1)
 
-    # Auto-check for updates on user-facing commands
-    if args.command != "check-update":
-        _check_for_updates()
+    # Only commands that talk to the API need credentials from .env
+    if args.command in ("init", "join", "act"):
+        load_env()
+
+    # Auto-check for updates on user-facing commands. Skipped for the
+    # fast-path commands agents call in tight loops (observe emits JSON on
+    # stdout that a banner would corrupt). Runs in a daemon thread so a
+    # slow network never stalls the command itself; the short join gives
+    # an already-finished check a chance to print its banner.
+    checker = None
+    if args.command not in ("check-update", "observe", "act", "status", "cleanup", "_stream-worker"):
+        import threading
+        checker = threading.Thread(target=_check_for_updates, daemon=True)
+        checker.start()
 
     args.func(args)
 
+    if checker is not None:
+        checker.join(timeout=0.1)
+
 
 if __name__ == "__main__":
     main()